@@ -4,6 +4,7 @@ import logging
 from configparser import ConfigParser
 from pc_power_controller import PowerStateController
 from pc_power_status_reader import PowerStatusReader
+from libs.edge_trace import EdgeTraceRecorder
 
 
 run_log = logging.getLogger(__name__)
@@ -32,6 +33,14 @@ def load_gpio_configs(filename):
     return loaded_pin_directory
 
 
+def load_trace_configs(filename):
+    gpio_config = ConfigParser()
+    gpio_config.read(filename)
+    trace_filename = gpio_config.get("EDGE_TRACE", "trace_file", fallback="").strip()
+    run_log.debug("Loaded Edge Trace File = \'{0}\' from \'{1}\'".format(trace_filename, filename))
+    return trace_filename
+
+
 if __name__ == '__main__':
     config_directory = str(sys.argv[1])
     log_directory = str(sys.argv[2])
@@ -47,13 +56,25 @@ if __name__ == '__main__':
                                             pin_directory["reboot_gpio"], log_level=logging.DEBUG)
     run_log.info("Loaded Status Controller")
 
-    input("turn on?\n")
-    print(state_controller.power_on())
-    input("turn off?\n")
-    print(state_controller.power_off())
-    input("reboot?\n")
-    print(state_controller.reboot())
+    edge_recorder = None
+    trace_filename = load_trace_configs(config_directory + "/gpio.conf")
+    if trace_filename:
+        edge_recorder = EdgeTraceRecorder(trace_filename)
+        state_reader.attach_edge_recorder(edge_recorder)
+        state_controller.attach_edge_recorder(edge_recorder)
+        run_log.info("Recording Edge Trace to \'{0}\'".format(trace_filename))
+
+    try:
+        input("turn on?\n")
+        print(state_controller.power_on())
+        input("turn off?\n")
+        print(state_controller.power_off())
+        input("reboot?\n")
+        print(state_controller.reboot())
 
-    input("end?\n")
-    state_controller.shutdown_power_controller()
-    state_reader.shutdown_status_reader()
+        input("end?\n")
+    finally:
+        if edge_recorder is not None:
+            edge_recorder.close()
+        state_controller.shutdown_power_controller()
+        state_reader.shutdown_status_reader()
@@ -14,11 +14,23 @@ class CustomOutputDevice(DigitalOutputDevice):
     # New Custom Name Value
     name = ""
 
+    # Optional raw edge callback, called with (device, ticks, pin_state) after each write
+    when_edge = None
+
     # override
     def __init__(self, name="", pin=None, active_high=True, initial_value=False, pin_factory=None):
         self.name = name
         super().__init__(pin=pin, active_high=active_high, initial_value=initial_value, pin_factory=pin_factory)
 
+    # override
+    def _write(self, value):
+        last_state = self.pin.state if self.pin is not None else None
+        super()._write(value)
+        state = self._value_to_state(value)
+        # Only report writes that actually change the pin, not repeated on()/off() calls
+        if self.when_edge is not None and state != last_state:
+            self.when_edge(self, self.pin_factory.ticks(), state)
+
 
 class HighTriggerSwitch(CustomOutputDevice):
     """ Subclass of CustomOutputDevice For use with
@@ -77,12 +89,21 @@ class CustomInputDevice(DigitalInputDevice):
     # New Custom Name Value
     name = ""
 
+    # Optional raw edge callback, called with (device, ticks, pin_state) on each pin change
+    when_edge = None
+
     # override
     def __init__(self, name="", pin=None, pull_up=False, active_state=None, bounce_time=None, pin_factory=None):
         self.name = name
         super().__init__(pin=pin, pull_up=pull_up, active_state=active_state,
                          bounce_time=bounce_time, pin_factory=pin_factory)
 
+    # override
+    def _pin_changed(self, ticks, state):
+        if self.when_edge is not None:
+            self.when_edge(self, ticks, state)
+        super()._pin_changed(ticks, state)
+
 
 class BasicHighSensor(CustomInputDevice):
     """ Subclass of CustomInputDevice for use with basic 3.3 volt input HI/LO values
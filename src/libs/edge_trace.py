@@ -0,0 +1,150 @@
+import struct
+import logging
+import threading
+from libs.custom_gpio_devices import CustomInputDevice
+
+
+# Trace File Layout
+#   header:  b"PMET" + version byte
+#   channel: b"C" + channel id + direction (b"I"/b"O") + name length + utf-8 name
+#   edge:    b"E" + channel id + raw pin state + microseconds since recording start
+_TRACE_MAGIC = b"PMET"
+_TRACE_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_CHANNEL_RECORD = struct.Struct("<cBcB")
+_EDGE_RECORD = struct.Struct("<cBBQ")
+
+INPUT_CHANNEL = "I"
+OUTPUT_CHANNEL = "O"
+
+
+class EdgeTraceRecorder:
+    """
+    Record timestamped raw pin edges from custom input and output devices
+    to a compact binary trace file for later replay
+    """
+
+    _recorder_log = logging.getLogger(__name__)
+
+    def __init__(self, filename):
+        """
+        Open a new trace file for recording
+
+        :param filename: Path of the trace file to create/ overwrite
+        :type filename: str
+        """
+        self._lock = threading.Lock()
+        self._devices = []
+        self._pin_factory = None
+        self._start_ticks = None
+        self._recording = True
+        # Unbuffered so the edges leading up to a crash or power loss reach the file
+        self._trace_file = open(filename, "wb", buffering=0)
+        self._trace_file.write(_HEADER.pack(_TRACE_MAGIC, _TRACE_VERSION))
+
+    def _record_edge(self, device, ticks, state):
+        """
+        Write a single edge record for a watched device
+        Used as the device when_edge callback
+        """
+        elapsed_us = max(0, int(self._pin_factory.ticks_diff(ticks, self._start_ticks) * 1000000))
+        with self._lock:
+            if not self._recording:
+                return
+            channel_id = self._devices.index(device)
+            self._write_record(_EDGE_RECORD.pack(b"E", channel_id, int(bool(state)), elapsed_us))
+
+    def _write_record(self, record):
+        """
+        Write a record to the trace file, stopping recording if the write fails
+        Trace errors must never reach the device being controlled
+        Intended to be called while holding the recorder lock
+        """
+        try:
+            self._trace_file.write(record)
+        except OSError as os_error:
+            self._recorder_log.error("{0}: Unable to write edge trace, recording stopped".format(os_error))
+            self._recording = False
+            try:
+                self._trace_file.close()
+            except OSError:
+                pass
+
+    def watch(self, device):
+        """
+        Start recording edges of a custom GPIO device
+        The current pin state is recorded as the first edge of the channel
+
+        :param device: Device to record
+        :type device: CustomInputDevice or CustomOutputDevice
+        """
+        direction = INPUT_CHANNEL if isinstance(device, CustomInputDevice) else OUTPUT_CHANNEL
+        name = device.name.encode("utf-8")
+        with self._lock:
+            # Edge times are measured in ticks of the first watched device's pin factory
+            if self._start_ticks is None:
+                self._pin_factory = device.pin_factory
+                self._start_ticks = self._pin_factory.ticks()
+            self._devices.append(device)
+            if self._recording:
+                self._write_record(_CHANNEL_RECORD.pack(b"C", len(self._devices) - 1,
+                                                        direction.encode("ascii"), len(name)) + name)
+        self._record_edge(device, self._pin_factory.ticks(), device.pin.state)
+        device.when_edge = self._record_edge
+
+    def close(self):
+        """
+        Stop recording all watched devices and close the trace file
+        """
+        for device in self._devices:
+            device.when_edge = None
+        with self._lock:
+            self._recording = False
+            self._trace_file.close()
+
+
+def read_edge_trace(filename):
+    """
+    Load a trace file written by EdgeTraceRecorder
+
+    :param filename: Path of the trace file to load
+    :type filename: str
+    :return: Tuple of channels {channel_id: (name, direction)} and
+        time ordered edges [(microseconds, channel_id, state)]
+    :rtype: tuple
+    """
+    with open(filename, "rb") as trace_file:
+        data = trace_file.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("{0}: Edge trace file header is missing or incomplete".format(filename))
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != _TRACE_MAGIC or version != _TRACE_VERSION:
+        raise ValueError("{0}: Not a version {1} edge trace file".format(filename, _TRACE_VERSION))
+
+    channels = {}
+    edges = []
+    offset = _HEADER.size
+    while offset < len(data):
+        kind = data[offset:offset + 1]
+        try:
+            if kind == b"C":
+                _, channel_id, direction, name_length = _CHANNEL_RECORD.unpack_from(data, offset)
+                offset += _CHANNEL_RECORD.size
+                if offset + name_length > len(data):
+                    break
+                channels[channel_id] = (data[offset:offset + name_length].decode("utf-8"),
+                                        direction.decode("ascii"))
+                offset += name_length
+            elif kind == b"E":
+                _, channel_id, state, elapsed_us = _EDGE_RECORD.unpack_from(data, offset)
+                offset += _EDGE_RECORD.size
+                edges.append((elapsed_us, channel_id, state))
+            else:
+                raise ValueError("{0}: Corrupt edge trace record at byte {1}".format(filename, offset))
+        except struct.error:
+            # Trace cut short (e.g. Pi lost power mid-write), keep the complete records
+            break
+    # Input edges carry their own callback ticks while output edges are stamped by the writing thread,
+    # so records are not written strictly in time order. The sort is stable for equal times.
+    edges.sort(key=lambda edge: edge[0])
+    return channels, edges
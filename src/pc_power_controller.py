@@ -223,5 +223,15 @@ class PowerStateController:
                 message="Power Off Command NOT Sent: PC Power State {0}".format(last_status_string))
         return return_message
 
+    def attach_edge_recorder(self, edge_recorder):
+        """
+        Record raw edges of the Power Switch and Reboot Switch
+
+        :param edge_recorder: Recorder to write the edges to
+        :type edge_recorder: EdgeTraceRecorder
+        """
+        edge_recorder.watch(self._power_switch)
+        edge_recorder.watch(self._reboot_switch)
+
     def shutdown_power_controller(self):
         self._cleanup_output_devices()
@@ -24,6 +24,8 @@ class PowerStatusReader:
     _status_filename = "./config/power_status"
     _buzzer_filename = "./config/debug_buzzer"
 
+    _poll_interval_seconds = 0.01
+
     _listeners = []
 
     def __init__(self, status_gpio, buzzer_gpio, log_level=logging.INFO):
@@ -96,16 +98,27 @@ class PowerStatusReader:
         """
         self._reader_log.info("Power Status Listening Process Starting")
         while True:
-            current_status = self._read_power_status()
-            with open(self._status_filename, 'r') as status_file:
-                last_status = int(status_file.readline())
-            if not current_status == last_status:
-                with open(self._status_filename, 'w') as status_file:
-                    status_file.write(str(current_status))
-                self._reader_log.info("Power Status changed from {0} to {1}".format(
-                    PowerStatus.status_string[last_status],
-                    PowerStatus.status_string[current_status]))
-            time.sleep(0.01)
+            self._update_power_status()
+            time.sleep(self._poll_interval_seconds)
+
+    def _update_power_status(self):
+        """
+        Check the power status pin once and update the power_status file if it changed
+
+        :return: New power status if it changed, otherwise None
+        :rtype: int
+        """
+        current_status = self._read_power_status()
+        with open(self._status_filename, 'r') as status_file:
+            last_status = int(status_file.readline())
+        if not current_status == last_status:
+            with open(self._status_filename, 'w') as status_file:
+                status_file.write(str(current_status))
+            self._reader_log.info("Power Status changed from {0} to {1}".format(
+                PowerStatus.status_string[last_status],
+                PowerStatus.status_string[current_status]))
+            return current_status
+        return None
 
     def _read_power_status(self):
         """
@@ -127,7 +140,7 @@ class PowerStatusReader:
         self._reader_log.info("Buzzer Listening Thread Starting")
         while True:
             self._buzzer_sensor.when_activated = lambda: self._count_buzz()
-            time.sleep(0.01)
+            time.sleep(self._poll_interval_seconds)
 
     def _count_buzz(self):
         """
@@ -139,6 +152,7 @@ class PowerStatusReader:
         with open(self._buzzer_filename, 'w') as buzzer_file:
             buzzer_file.write(str(buzz_count + 1))
         self._reader_log.info("Debug Buzzer Read: {0}".format(str(buzz_count)))
+        return buzz_count + 1
 
     def _cleanup_input_devices(self):
         """
@@ -194,26 +208,47 @@ class PowerStatusReader:
         except RuntimeError as rt_error:
             self._reader_log.critical("{0} Unable to kill listener processes".format(rt_error))
 
-    def _start_power_status_listener(self):
+    def _create_status_file(self):
         """
-        Begin processes to regularly update the power_status file with accurate power status
+        Create the power_status file with an Unknown power status
         """
         with open(self._status_filename, 'w') as status_file:
             status_file.write(str(PowerStatus.UNKNOWN))
         self._reader_log.info("Created power_status tracking file")
 
+    def _create_buzzer_file(self):
+        """
+        Create the debug_buzzer file with a zero buzz count
+        """
+        with open(self._buzzer_filename, 'w') as buzzer_file:
+            buzzer_file.write("0")
+        self._reader_log.info("Created debug_buzzer tracking file")
+
+    def _start_power_status_listener(self):
+        """
+        Begin processes to regularly update the power_status file with accurate power status
+        """
+        self._create_status_file()
         self._listen_for_power_status_change()
 
     def _start_buzzer_listener(self):
         """
         Begin processes to regularly update the debug_buzzer file
         """
-        with open(self._buzzer_filename, 'w') as buzzer_file:
-            buzzer_file.write("0")
-        self._reader_log.info("Created debug_buzzer tracking file")
+        self._create_buzzer_file()
         self._listen_for_buzzer_start()
 
     # PowerStatusReader public methods
+    def attach_edge_recorder(self, edge_recorder):
+        """
+        Record raw edges of the Status Sensor and Buzzer Sensor
+
+        :param edge_recorder: Recorder to write the edges to
+        :type edge_recorder: EdgeTraceRecorder
+        """
+        edge_recorder.watch(self._status_sensor)
+        edge_recorder.watch(self._buzzer_sensor)
+
     def shutdown_status_reader(self):
         """
         Utility function to cleanly shut-down PowerStatusReader
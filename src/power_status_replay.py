@@ -0,0 +1,198 @@
+import os
+import sys
+import time
+import difflib
+import logging
+import argparse
+import tempfile
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+from power_status import PowerStatus
+from pc_power_status_reader import PowerStatusReader
+from libs.edge_trace import read_edge_trace, INPUT_CHANNEL
+
+
+class ReplayStatusReader(PowerStatusReader):
+    """
+    PowerStatusReader driven by a recorded edge trace on mock pins
+    Listener processes are replaced by polling the status pin at the reader's
+    poll interval in trace time, so results do not depend on replay speed
+    """
+
+    # Mock pins are matched to trace channels by sensor name, the GPIO IDs only need to be unique
+    _replay_status_gpio = 9
+    _replay_buzzer_gpio = 10
+
+    def __init__(self, work_directory, log_level=logging.WARNING):
+        """
+        Initialize ReplayStatusReader with its tracking files in a separate directory
+
+        :param work_directory: Directory for the power_status and debug_buzzer files
+        :type work_directory: str
+        :param log_level: desired log level for the reader
+        """
+        self._status_filename = os.path.join(work_directory, "power_status")
+        self._buzzer_filename = os.path.join(work_directory, "debug_buzzer")
+        self._transitions = []
+        self._trace_us = 0
+        super().__init__(self._replay_status_gpio, self._replay_buzzer_gpio, log_level=log_level)
+
+    # override
+    def _start_logging(self, log_level=logging.INFO):
+        """
+        Set the reader log level without adding another reader log file handler
+        """
+        self._reader_log.setLevel(log_level)
+
+    # override
+    def _start_listener_processes(self):
+        """
+        Create tracking files and listen for buzzes in this process
+        """
+        self._create_status_file()
+        self._create_buzzer_file()
+        self._buzzer_sensor.when_activated = lambda: self._count_buzz()
+
+    # override
+    def _count_buzz(self):
+        buzz_count = super()._count_buzz()
+        self._transitions.append((self._trace_us, "buzz", str(buzz_count)))
+        return buzz_count
+
+    def replay(self, channels, edges, speed=1.0):
+        """
+        Feed recorded edges to the mock sensor pins and collect the resulting state transitions
+
+        :param channels: Trace channels {channel_id: (name, direction)}
+        :type channels: dict
+        :param edges: Time ordered trace edges [(microseconds, channel_id, state)]
+        :type edges: list
+        :param speed: Replay speed multiplier, 1.0 for real time or 0 for no delay
+        :type speed: float
+        :return: Transitions [(microseconds, event, value)] in trace time
+        :rtype: list
+        """
+        sensors = {self._status_sensor.name: self._status_sensor,
+                   self._buzzer_sensor.name: self._buzzer_sensor}
+        input_pins = {}
+        for channel_id, (name, direction) in channels.items():
+            if direction != INPUT_CHANNEL:
+                continue
+            if name in sensors:
+                input_pins[channel_id] = sensors[name].pin
+            else:
+                self._reader_log.warning("Ignoring trace input channel \'{0}\' with no matching sensor".format(name))
+
+        poll_us = int(self._poll_interval_seconds * 1000000)
+        self._transitions = []
+        replay_start = time.monotonic()
+        for index, (elapsed_us, channel_id, state) in enumerate(edges):
+            if speed:
+                delay = replay_start + elapsed_us / 1000000 / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            self._trace_us = elapsed_us
+            if channel_id in input_pins:
+                if state:
+                    input_pins[channel_id].drive_high()
+                else:
+                    input_pins[channel_id].drive_low()
+            elif channel_id not in channels:
+                raise ValueError("Trace edge references undeclared channel {0}".format(channel_id))
+            elif channels[channel_id][1] != INPUT_CHANNEL:
+                self._transitions.append((elapsed_us, "output " + channels[channel_id][0], str(state)))
+
+            # The status listener only sees this edge if it polls before the next edge arrives
+            next_poll_us = -(-elapsed_us // poll_us) * poll_us
+            if index + 1 == len(edges) or next_poll_us < edges[index + 1][0]:
+                self._trace_us = next_poll_us
+                new_status = self._update_power_status()
+                if new_status is not None:
+                    self._transitions.append((next_poll_us, "power_status", PowerStatus.status_string[new_status]))
+        return self._transitions
+
+
+def replay_edge_trace(trace_filename, speed=1.0):
+    """
+    Replay a recorded edge trace through a PowerStatusReader on mock pins
+
+    :param trace_filename: Trace file written by EdgeTraceRecorder
+    :type trace_filename: str
+    :param speed: Replay speed multiplier, 1.0 for real time or 0 for no delay
+    :type speed: float
+    :return: Transitions [(microseconds, event, value)] in trace time
+    :rtype: list
+    """
+    channels, edges = read_edge_trace(trace_filename)
+    last_pin_factory = Device.pin_factory
+    Device.pin_factory = MockFactory()
+    try:
+        with tempfile.TemporaryDirectory() as work_directory:
+            replay_reader = ReplayStatusReader(work_directory)
+            try:
+                return replay_reader.replay(channels, edges, speed=speed)
+            finally:
+                replay_reader.shutdown_status_reader()
+    finally:
+        Device.pin_factory.close()
+        Device.pin_factory = last_pin_factory
+
+
+def write_transitions(filename, transitions):
+    """
+    Write replayed transitions to a tab separated baseline file
+    """
+    with open(filename, 'w') as baseline_file:
+        for elapsed_us, event, value in transitions:
+            baseline_file.write("{0}\t{1}\t{2}\n".format(elapsed_us, event, value))
+
+
+def read_transitions(filename):
+    """
+    Read transitions from a baseline file written by write_transitions
+    """
+    transitions = []
+    with open(filename, 'r') as baseline_file:
+        for line in baseline_file:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            elapsed_us, event, value = line.split("\t")
+            transitions.append((int(elapsed_us), event, value))
+    return transitions
+
+
+def compare_transitions(baseline, transitions):
+    """
+    Compare replayed transitions against a baseline
+
+    :return: Unified diff lines, empty if the transitions match the baseline
+    :rtype: list
+    """
+    return list(difflib.unified_diff(["{0}\t{1}\t{2}".format(*transition) for transition in baseline],
+                                     ["{0}\t{1}\t{2}".format(*transition) for transition in transitions],
+                                     fromfile="baseline", tofile="replay", lineterm=""))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay a recorded edge trace through PowerStatusReader")
+    parser.add_argument("trace_file", help="Trace file written by EdgeTraceRecorder")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Replay speed multiplier, e.g. 100-1000 for CI, 0 for no delay (default: 1.0)")
+    parser.add_argument("--baseline", help="Compare the replayed transitions against this baseline file")
+    parser.add_argument("--save-baseline", help="Write the replayed transitions to this baseline file")
+    args = parser.parse_args()
+    if args.speed < 0:
+        parser.error("--speed must be 0 or greater")
+
+    replay_start = time.monotonic()
+    replayed_transitions = replay_edge_trace(args.trace_file, speed=args.speed)
+    print("Replayed {0} transitions in {1:.3f} seconds".format(len(replayed_transitions),
+                                                              time.monotonic() - replay_start))
+    if args.save_baseline:
+        write_transitions(args.save_baseline, replayed_transitions)
+    if args.baseline:
+        differences = compare_transitions(read_transitions(args.baseline), replayed_transitions)
+        for difference in differences:
+            print(difference)
+        sys.exit(1 if differences else 0)
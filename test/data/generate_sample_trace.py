@@ -0,0 +1,64 @@
+"""
+Regenerate sample_status_trace.bin and its baseline on mock pins
+
+Run from the repository root, then review the baseline diff before committing:
+    python test/data/generate_sample_trace.py
+"""
+import os
+import sys
+import time
+
+_data_directory = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(_data_directory)), "src"))
+
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+from libs.custom_gpio_devices import BasicHighSensor, LowTriggerSwitch
+from libs.edge_trace import EdgeTraceRecorder
+from power_status_replay import replay_edge_trace, write_transitions
+
+trace_filename = os.path.join(_data_directory, "sample_status_trace.bin")
+baseline_filename = os.path.join(_data_directory, "sample_status_trace_baseline.txt")
+
+
+def record_sample_trace():
+    status_sensor = BasicHighSensor(name="Power Status Sensor", pin=9)
+    buzzer_sensor = BasicHighSensor(name="Buzzer Sensor", pin=10)
+    power_switch = LowTriggerSwitch(name="Power Switch", pin=22)
+    edge_recorder = EdgeTraceRecorder(trace_filename)
+    for device in (status_sensor, buzzer_sensor, power_switch):
+        edge_recorder.watch(device)
+
+    # Power on press, then a status flap shorter than the reader poll interval before it settles
+    power_switch.close_circuit()
+    time.sleep(0.05)
+    power_switch.open_circuit()
+    status_sensor.pin.drive_high()
+    time.sleep(0.003)
+    status_sensor.pin.drive_low()
+    time.sleep(0.002)
+    status_sensor.pin.drive_high()
+    # Short beep storm during boot
+    for _ in range(5):
+        time.sleep(0.015)
+        buzzer_sensor.pin.drive_high()
+        time.sleep(0.015)
+        buzzer_sensor.pin.drive_low()
+    # Power off press
+    time.sleep(0.05)
+    power_switch.close_circuit()
+    time.sleep(0.08)
+    power_switch.open_circuit()
+    time.sleep(0.02)
+    status_sensor.pin.drive_low()
+
+    edge_recorder.close()
+    for device in (status_sensor, buzzer_sensor, power_switch):
+        device.close()
+
+
+if __name__ == '__main__':
+    Device.pin_factory = MockFactory()
+    record_sample_trace()
+    Device.pin_factory.close()
+    write_transitions(baseline_filename, replay_edge_trace(trace_filename, speed=0))
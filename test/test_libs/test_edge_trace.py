@@ -0,0 +1,129 @@
+import os
+import struct
+import tempfile
+import unittest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+from libs.custom_gpio_devices import BasicHighSensor, LowTriggerSwitch
+from libs.edge_trace import EdgeTraceRecorder, read_edge_trace, INPUT_CHANNEL, OUTPUT_CHANNEL
+
+
+class _FailingTraceFile:
+    """ Trace file stand-in that fails every write like a full or failing SD card """
+
+    closed = False
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def close(self):
+        self.closed = True
+
+
+class TestEdgeTrace(unittest.TestCase):
+
+    def setUp(self):
+        self._last_pin_factory = Device.pin_factory
+        Device.pin_factory = MockFactory()
+        self._work_directory = tempfile.TemporaryDirectory()
+        self._trace_filename = os.path.join(self._work_directory.name, "trace.bin")
+
+    def tearDown(self):
+        Device.pin_factory.close()
+        Device.pin_factory = self._last_pin_factory
+        self._work_directory.cleanup()
+
+    def _record_sample_trace(self):
+        status_sensor = BasicHighSensor(name="Power Status Sensor", pin=9)
+        power_switch = LowTriggerSwitch(name="Power Switch", pin=22)
+        edge_recorder = EdgeTraceRecorder(self._trace_filename)
+        edge_recorder.watch(status_sensor)
+        edge_recorder.watch(power_switch)
+        power_switch.close_circuit()
+        power_switch.close_circuit()
+        power_switch.open_circuit()
+        status_sensor.pin.drive_high()
+        status_sensor.pin.drive_low()
+        edge_recorder.close()
+
+    def test_write_error_does_not_break_devices(self):
+        status_sensor = BasicHighSensor(name="Power Status Sensor", pin=9)
+        power_switch = LowTriggerSwitch(name="Power Switch", pin=22)
+        activations = []
+        status_sensor.when_activated = lambda: activations.append(True)
+        edge_recorder = EdgeTraceRecorder(self._trace_filename)
+        edge_recorder.watch(status_sensor)
+        edge_recorder.watch(power_switch)
+        edge_recorder._trace_file.close()
+        edge_recorder._trace_file = _FailingTraceFile()
+
+        with self.assertLogs("libs.edge_trace", level="ERROR") as recorder_logs:
+            power_switch.close_circuit()
+            self.assertFalse(power_switch.pin.state)
+            power_switch.open_circuit()
+            self.assertTrue(power_switch.pin.state)
+            status_sensor.pin.drive_high()
+        self.assertEqual(activations, [True])
+        self.assertEqual(len(recorder_logs.records), 1)
+        edge_recorder.close()
+
+    def _write_trace(self, data):
+        with open(self._trace_filename, "wb") as trace_file:
+            trace_file.write(data)
+
+    def test_round_trip(self):
+        self._record_sample_trace()
+        channels, edges = read_edge_trace(self._trace_filename)
+        self.assertEqual(channels, {0: ("Power Status Sensor", INPUT_CHANNEL),
+                                    1: ("Power Switch", OUTPUT_CHANNEL)})
+        # Initial states, then one switch press (repeated close is not an edge) and one status pulse
+        self.assertEqual([(channel_id, state) for _, channel_id, state in edges],
+                         [(0, 0), (1, 1), (1, 0), (1, 1), (0, 1), (0, 0)])
+        self.assertEqual([edge[0] for edge in edges], sorted(edge[0] for edge in edges))
+
+    def test_sorts_out_of_order_edges(self):
+        edge_records = [(0, 0, 0), (40000, 1, 1), (25000, 0, 1), (40000, 0, 0), (50000, 1, 0)]
+        self._write_trace(b"PMET\x01" + b"".join(struct.pack("<cBBQ", b"E", channel_id, state, elapsed_us)
+                                                 for elapsed_us, channel_id, state in edge_records))
+        _, edges = read_edge_trace(self._trace_filename)
+        self.assertEqual(edges, [(0, 0, 0), (25000, 0, 1), (40000, 1, 1), (40000, 0, 0), (50000, 1, 0)])
+
+    def test_rejects_bad_magic(self):
+        self._write_trace(b"XXXX\x01")
+        with self.assertRaises(ValueError):
+            read_edge_trace(self._trace_filename)
+
+    def test_rejects_bad_version(self):
+        self._write_trace(b"PMET\x02")
+        with self.assertRaises(ValueError):
+            read_edge_trace(self._trace_filename)
+
+    def test_rejects_missing_or_partial_header(self):
+        for data in (b"", b"PME"):
+            self._write_trace(data)
+            with self.assertRaises(ValueError):
+                read_edge_trace(self._trace_filename)
+
+    def test_drops_channel_record_truncated_in_name(self):
+        name = "Power Status Sensor".encode("utf-8")
+        self._write_trace(b"PMET\x01" + struct.pack("<cBcB", b"C", 0, b"I", len(name)) + name[:-4])
+        self.assertEqual(read_edge_trace(self._trace_filename), ({}, []))
+
+    def test_keeps_complete_records_of_truncated_trace(self):
+        self._record_sample_trace()
+        _, edges = read_edge_trace(self._trace_filename)
+        with open(self._trace_filename, "rb") as trace_file:
+            data = trace_file.read()
+        self._write_trace(data[:-3])
+        channels, truncated_edges = read_edge_trace(self._trace_filename)
+        self.assertEqual(len(channels), 2)
+        self.assertEqual(truncated_edges, edges[:-1])
+
+    def test_rejects_corrupt_record_kind(self):
+        self._write_trace(b"PMET\x01" + struct.pack("<cBBQ", b"Z", 0, 1, 0))
+        with self.assertRaises(ValueError):
+            read_edge_trace(self._trace_filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import time
+import struct
+import tempfile
+import unittest
+from gpiozero import Device
+from gpiozero.pins.mock import MockFactory
+from libs.edge_trace import INPUT_CHANNEL, OUTPUT_CHANNEL
+from power_status_replay import ReplayStatusReader, replay_edge_trace, read_transitions, compare_transitions
+
+# Regenerate the sample trace and baseline with test/data/generate_sample_trace.py
+_data_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+_sample_trace_filename = os.path.join(_data_directory, "sample_status_trace.bin")
+_sample_baseline_filename = os.path.join(_data_directory, "sample_status_trace_baseline.txt")
+
+_status_channels = {0: ("Power Status Sensor", INPUT_CHANNEL), 1: ("Power Switch", OUTPUT_CHANNEL)}
+
+
+class TestPowerStatusReplay(unittest.TestCase):
+
+    def setUp(self):
+        self._work_directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._work_directory.cleanup()
+
+    def _replay(self, edges, speed=0):
+        last_pin_factory = Device.pin_factory
+        Device.pin_factory = MockFactory()
+        try:
+            replay_reader = ReplayStatusReader(self._work_directory.name)
+            try:
+                return replay_reader.replay(_status_channels, edges, speed=speed)
+            finally:
+                replay_reader.shutdown_status_reader()
+        finally:
+            Device.pin_factory.close()
+            Device.pin_factory = last_pin_factory
+
+    def test_sample_trace_matches_baseline(self):
+        transitions = replay_edge_trace(_sample_trace_filename, speed=0)
+        baseline = read_transitions(_sample_baseline_filename)
+        self.assertEqual(compare_transitions(baseline, transitions), [])
+
+    def test_compare_reports_changed_transitions(self):
+        transitions = replay_edge_trace(_sample_trace_filename, speed=0)
+        baseline = read_transitions(_sample_baseline_filename)
+        self.assertNotEqual(compare_transitions(baseline[1:], transitions), [])
+        shifted_us, event, value = baseline[-1]
+        self.assertNotEqual(compare_transitions(baseline[:-1] + [(shifted_us + 1, event, value)], transitions), [])
+
+    def test_status_pulse_between_polls_is_not_seen(self):
+        transitions = self._replay([(0, 0, 0), (12000, 0, 1), (18000, 0, 0)])
+        self.assertEqual(transitions, [(0, "power_status", "Powered Off")])
+
+    def test_status_pulse_across_poll_is_seen(self):
+        transitions = self._replay([(0, 0, 0), (12000, 0, 1), (25000, 0, 0)])
+        self.assertEqual(transitions, [(0, "power_status", "Powered Off"),
+                                       (20000, "power_status", "Powered On"),
+                                       (30000, "power_status", "Powered Off")])
+
+    def test_accelerated_replay_follows_trace_time(self):
+        trace_seconds = 2.0
+        speed = 100
+        edges = [(0, 0, 0), (1000000, 0, 1), (int(trace_seconds * 1000000), 0, 0)]
+        replay_start = time.monotonic()
+        self._replay(edges, speed=speed)
+        replay_seconds = time.monotonic() - replay_start
+        self.assertGreaterEqual(replay_seconds, trace_seconds / speed)
+        self.assertLess(replay_seconds, trace_seconds / speed + 0.5)
+
+    def test_out_of_order_trace_replays_in_time_order(self):
+        trace_filename = os.path.join(self._work_directory.name, "trace.bin")
+        edge_records = [(0, 0, 0), (40000, 1, 1), (25000, 0, 1), (50000, 1, 0)]
+        with open(trace_filename, "wb") as trace_file:
+            trace_file.write(b"PMET\x01")
+            for channel_id, (name, direction) in _status_channels.items():
+                trace_file.write(struct.pack("<cBcB", b"C", channel_id, direction.encode("ascii"), len(name)))
+                trace_file.write(name.encode("utf-8"))
+            for elapsed_us, channel_id, state in edge_records:
+                trace_file.write(struct.pack("<cBBQ", b"E", channel_id, state, elapsed_us))
+        transitions = replay_edge_trace(trace_filename, speed=0)
+        self.assertEqual(transitions, [(0, "power_status", "Powered Off"),
+                                       (30000, "power_status", "Powered On"),
+                                       (40000, "output Power Switch", "1"),
+                                       (50000, "output Power Switch", "0")])
+
+
+if __name__ == '__main__':
+    unittest.main()